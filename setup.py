@@ -0,0 +1,45 @@
+"""
+Build script: compiles src/classifier.py to a C extension with mypyc.
+
+The compiled module shadows classifier.py on import. If mypyc is unavailable,
+the C build fails (e.g. no compiler), or ORC_PURE_PYTHON=1 is set, the package
+installs as plain Python with identical behaviour.
+"""
+
+import os
+import sys
+
+from setuptools import setup
+from setuptools.command.build_ext import build_ext
+
+
+class OptionalBuildExt(build_ext):
+    """Fall back to pure Python, rather than failing the install, if the extension will not compile."""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as exc:  # setuptools raises several types for a missing/broken compiler
+            # mypyc emits a runtime library plus a shim per module; drop any that did
+            # build so a half-compiled package is never installed.
+            for ext in self.extensions:
+                path = self.get_ext_fullpath(ext.name)
+                if os.path.exists(path):
+                    os.remove(path)
+            print(
+                f"warning: could not compile the mypyc extension ({exc}); "
+                "installing the pure-Python classifier instead",
+                file=sys.stderr,
+            )
+
+
+ext_modules = []
+if not os.environ.get("ORC_PURE_PYTHON"):
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        pass
+    else:
+        ext_modules = mypycify(["src/classifier.py"], opt_level="3")
+
+setup(ext_modules=ext_modules, cmdclass={"build_ext": OptionalBuildExt})
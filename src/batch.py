@@ -0,0 +1,140 @@
+"""
+Vectorised classification for many snapshots at once (screeners, backtests).
+
+The rules mirror `src.classifier.classify` but are evaluated column-wise as
+boolean NumPy masks. Only the posture and confidence are produced here; use the
+scalar classifier when you need the human-readable reasons.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from src.classifier import REGIME_HIGH, REGIME_LOW
+from src.frame import OBJECTIVE_CODES, OBJECTIVE_UNKNOWN, OptionSnapshotFrame, dte_column
+from src.models import OptionSnapshot
+from src._decide import (
+    BUY_PREMIUM,
+    CONF_HIGH,
+    CONF_LOW,
+    CONF_MEDIUM,
+    DO_NOTHING,
+    HAVE_NUMBA,
+    HEDGE,
+    SELL_PREMIUM,
+    _decide_many,
+    current_thresholds,
+)
+
+
+BATCH_DTYPE = np.dtype(
+    [
+        ("iv_rank", "f4"),
+        ("dte", "i2"),
+        ("spread", "f4"),
+        ("event", "?"),
+        ("objective", "u1"),
+    ]
+)
+
+
+def snapshots_to_array(snapshots: Iterable[OptionSnapshot]) -> np.ndarray:
+    """
+    Pack snapshots into a structured array with `BATCH_DTYPE`.
+
+    Raises ValueError if a days_to_expiry does not fit the int16 `dte` field.
+    """
+    snapshots = list(snapshots)
+    arr = np.empty(len(snapshots), dtype=BATCH_DTYPE)
+    arr["iv_rank"] = [s.iv_rank for s in snapshots]
+    arr["dte"] = dte_column([s.days_to_expiry for s in snapshots])
+    arr["spread"] = [s.bid_ask_spread_pct for s in snapshots]
+    arr["event"] = [s.upcoming_event for s in snapshots]
+    arr["objective"] = [OBJECTIVE_CODES.get(s.objective, OBJECTIVE_UNKNOWN) for s in snapshots]
+    return arr
+
+
+def classify_batch(snapshots: OptionSnapshotFrame | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Classify every snapshot in an `OptionSnapshotFrame` or a `BATCH_DTYPE`
+    structured array.
+
+    Returns `(action, confidence)` as int8 arrays of `Action` / `Confidence`
+    codes. Uses the Numba kernel when available, otherwise NumPy masks.
+    Thresholds are read from `src.config` on every call.
+    """
+    if isinstance(snapshots, OptionSnapshotFrame):
+        columns = (
+            snapshots.iv_rank,
+            snapshots.days_to_expiry,
+            snapshots.bid_ask_spread_pct,
+            snapshots.upcoming_event,
+            snapshots.objective,
+        )
+    else:
+        columns = (
+            snapshots["iv_rank"],
+            snapshots["dte"],
+            snapshots["spread"],
+            snapshots["event"],
+            snapshots["objective"],
+        )
+    args = (*columns, *current_thresholds())
+    if HAVE_NUMBA:
+        return _decide_many(*args)
+    return _classify_masks(*args)
+
+
+def _classify_masks(
+    iv_rank: np.ndarray,
+    dte: np.ndarray,
+    spread: np.ndarray,
+    event: np.ndarray,
+    objective: np.ndarray,
+    iv_rank_low: np.float32,
+    iv_rank_high: np.float32,
+    min_dte: int,
+    preferred_min_dte: int,
+    preferred_max_dte: int,
+    max_spread: np.float32,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Same 0/1/2 arithmetic as src.classifier._vol_regime_code, one pass per bound
+    regime = (iv_rank >= iv_rank_high).astype(np.int8) + (iv_rank > iv_rank_low)
+    low = regime == REGIME_LOW
+    high = regime == REGIME_HIGH
+
+    speculate = objective == OBJECTIVE_CODES["speculate"]
+    income = objective == OBJECTIVE_CODES["income"]
+    hedge = objective == OBJECTIVE_CODES["hedge"]
+
+    # Guardrails short-circuit everything below them
+    blocked = (spread > max_spread) | ((dte < min_dte) & ~hedge)
+
+    preferred_dte = (dte >= preferred_min_dte) & (dte <= preferred_max_dte)
+
+    action = np.select(
+        [
+            blocked,
+            speculate & low & (dte >= preferred_min_dte) & ~event,
+            speculate & high,
+            income & high & (dte >= min_dte) & (dte <= preferred_max_dte),
+            hedge,
+        ],
+        [DO_NOTHING, BUY_PREMIUM, SELL_PREMIUM, SELL_PREMIUM, HEDGE],
+        default=DO_NOTHING,
+    ).astype(np.int8)
+
+    confidence = np.select(
+        [
+            blocked,
+            event & (action == BUY_PREMIUM),
+            (dte < preferred_min_dte) & (action != HEDGE),
+            (low | high) & ~event & preferred_dte & (action != DO_NOTHING),
+        ],
+        [CONF_LOW, CONF_LOW, CONF_LOW, CONF_HIGH],
+        default=CONF_MEDIUM,
+    ).astype(np.int8)
+
+    return action, confidence
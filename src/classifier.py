@@ -1,162 +1,352 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Dict, List, Literal, TypedDict
+import functools
+from bisect import bisect_right
+from enum import IntEnum
+from typing import Callable, NamedTuple, Optional
 
-from src.models import OptionSnapshot
+from src.models import OBJECTIVES, OptionSnapshot
 from src import config
 
 
-Action = Literal[
+class Action(IntEnum):
+    NOTHING = 0
+    BUY = 1
+    SELL = 2
+    HEDGE = 3
+
+    @property
+    def label(self) -> str:
+        return _ACTION_LABEL[self]
+
+
+class Confidence(IntEnum):
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+    @property
+    def label(self) -> str:
+        return _CONFIDENCE_LABEL[self]
+
+
+# Display strings indexed by code; only materialised at the API boundary
+_ACTION_LABEL: tuple[str, ...] = (
+    "DO NOTHING",
     "BUY PREMIUM (prefer defined-risk spreads)",
     "SELL PREMIUM (use defined-risk structures)",
     "HEDGE (prefer spreads/collars for cost control)",
-    "DO NOTHING",
-]
+)
 
-Confidence = Literal["low", "medium", "high"]
+_CONFIDENCE_LABEL: tuple[str, ...] = ("low", "medium", "high")
 
 
-class Classification(TypedDict):
-    action: Action
-    confidence: Confidence
-    reasons: List[str]
+# Reason codes. `classify` records these instead of building strings; use
+# `describe` to render them for display.
+(
+    REASON_LIQUIDITY_BLOCK,
+    REASON_LIQUIDITY_OK,
+    REASON_SHORT_DTE_BLOCK,
+    REASON_SHORT_DTE,
+    REASON_IV_LOW,
+    REASON_IV_HIGH,
+    REASON_IV_MID,
+    REASON_EVENT,
+    REASON_DTE_PREFERRED,
+    REASON_DTE_BELOW_PREFERRED,
+    REASON_DTE_ABOVE_PREFERRED,
+    REASON_SPECULATE_BUY,
+    REASON_SPECULATE_SELL,
+    REASON_SPECULATE_NO_EDGE,
+    REASON_INCOME_SELL,
+    REASON_INCOME_LOW_IV,
+    REASON_INCOME_NEUTRAL,
+    REASON_HEDGE_LOW_IV,
+    REASON_HEDGE_HIGH_IV,
+    REASON_HEDGE_STAGED,
+    REASON_UNKNOWN_OBJECTIVE,
+    REASON_BUY_INTO_EVENT,
+    REASON_SHORT_DTE_CONFIDENCE,
+    REASON_CONFIDENCE_RAISED,
+) = range(24)
 
+def _build_templates() -> tuple[tuple[str, Optional[str]], ...]:
+    """
+    Reason text indexed by reason code, as `(template, snapshot_field)` pairs.
 
-def _vol_regime(iv_rank: float) -> Literal["low", "mid", "high"]:
-    if iv_rank <= config.IV_RANK_LOW:
-        return "low"
-    if iv_rank >= config.IV_RANK_HIGH:
-        return "high"
-    return "mid"
+    Config thresholds are baked in here once; the only per-call value is the
+    named snapshot field, substituted with `%` (None means the text is static).
+    """
+    spread_cap = f"{config.MAX_BID_ASK_SPREAD_PCT:.2f}"
+    return (
+        (f"Liquidity filter: bid–ask spread %.2f%% > {spread_cap}%% threshold", "bid_ask_spread_pct"),
+        (f"Liquidity OK: bid–ask spread %.2f%% ≤ {spread_cap}%%", "bid_ask_spread_pct"),
+        (
+            f"Very short DTE (%d) < {config.MIN_DTE}: gamma/theta risk is high (avoid unless explicitly hedging)",
+            "days_to_expiry",
+        ),
+        (f"Very short DTE (%d) < {config.MIN_DTE}: gamma/theta risk is high", "days_to_expiry"),
+        ("IV Rank low (%.0f) → options relatively cheap", "iv_rank"),
+        ("IV Rank high (%.0f) → options relatively expensive", "iv_rank"),
+        ("IV Rank mid (%.0f) → neutral volatility regime", "iv_rank"),
+        (f"Upcoming event within ~{config.EVENT_LOOKAHEAD_DAYS} days → IV distortion/IV crush risk likely", None),
+        (f"DTE in preferred window ({config.PREFERRED_MIN_DTE}–{config.PREFERRED_MAX_DTE})", None),
+        (f"DTE below preferred window (<{config.PREFERRED_MIN_DTE}) → higher gamma/theta sensitivity", None),
+        (f"DTE above preferred window (>{config.PREFERRED_MAX_DTE}) → more vega/carry, less capital efficient", None),
+        ("Objective = speculate: low IV + enough time + no event → better conditions to buy premium", None),
+        ("Objective = speculate: high IV → consider selling premium rather than buying it", None),
+        ("Objective = speculate: no clear edge from regime/time/event filters", None),
+        ("Objective = income: high IV + workable DTE → premium-selling conditions", None),
+        ("Objective = income: low IV → premium often too small for risk taken", None),
+        ("Objective = income: neutral setup", None),
+        ("Objective = hedge: low IV + longer DTE → protection relatively cheaper", None),
+        ("Objective = hedge: high IV → protection expensive; consider spreads/collars to reduce cost", None),
+        ("Objective = hedge: hedge can be staged/scaled to reduce timing risk", None),
+        ("Unknown objective (expected: speculate / income / hedge)", None),
+        ("Confidence lowered: buying premium into an event risks IV crush", None),
+        ("Confidence lowered: short DTE increases gamma/theta instability", None),
+        ("Confidence raised: strong vol regime + preferred DTE window + no event", None),
+    )
 
 
-def classify(snapshot: OptionSnapshot) -> Classification:
-    """
-    Classify an options market 'posture' based on volatility regime, time-to-expiry,
-    event risk, and liquidity. This is decision support / regime classification,
-    not a trade signal.
-    """
-    reasons: List[str] = []
+TEMPLATES = _build_templates()
 
-    # 1. Liquidity guardrail
-    if snapshot.bid_ask_spread_pct > config.MAX_BID_ASK_SPREAD_PCT:
-        return {
-            "action": "DO NOTHING",
-            "confidence": "low",
-            "reasons": [
-                f"Liquidity filter: bid–ask spread {snapshot.bid_ask_spread_pct:.2f}% "
-                f"> {config.MAX_BID_ASK_SPREAD_PCT:.2f}% threshold"
-            ],
-        }
-    reasons.append(
-        f"Liquidity OK: bid–ask spread {snapshot.bid_ask_spread_pct:.2f}% "
-        f"≤ {config.MAX_BID_ASK_SPREAD_PCT:.2f}%"
-    )
 
-    # 2. Time-to-expiry guardrail
-    if snapshot.days_to_expiry < config.MIN_DTE and snapshot.objective != "hedge":
+class ClassificationResult(NamedTuple):
+    action: Action
+    confidence: Confidence
+    reasons: tuple[int, ...]
+
+    def as_dict(self) -> dict:
+        """Public dict form: display labels for action/confidence, reason codes as a list."""
         return {
-            "action": "DO NOTHING",
-            "confidence": "low",
-            "reasons": [
-                f"Very short DTE ({snapshot.days_to_expiry}) < {config.MIN_DTE}: "
-                "gamma/theta risk is high (avoid unless explicitly hedging)"
-            ],
+            "action": self.action.label,
+            "confidence": self.confidence.label,
+            "reasons": list(self.reasons),
         }
 
-    if snapshot.days_to_expiry < config.MIN_DTE:
-        reasons.append(
-            f"Very short DTE ({snapshot.days_to_expiry}) < {config.MIN_DTE}: "
-            "gamma/theta risk is high"
-        )
 
-    # 3. Volatility regime
-    regime = _vol_regime(snapshot.iv_rank)
-    if regime == "low":
-        reasons.append(f"IV Rank low ({snapshot.iv_rank:.0f}) → options relatively cheap")
-    elif regime == "high":
-        reasons.append(f"IV Rank high ({snapshot.iv_rank:.0f}) → options relatively expensive")
-    else:
-        reasons.append(f"IV Rank mid ({snapshot.iv_rank:.0f}) → neutral volatility regime")
-
-    # 4. Event risk
-    if snapshot.upcoming_event:
-        reasons.append(
-            f"Upcoming event within ~{config.EVENT_LOOKAHEAD_DAYS} days → IV distortion/IV crush risk likely"
-        )
+def describe(result: ClassificationResult, snapshot: OptionSnapshot) -> list[str]:
+    """Render the reason codes of a classification as human-readable strings."""
+    lines = []
+    for code in result.reasons:
+        template, field = TEMPLATES[code]
+        lines.append(template if field is None else template % getattr(snapshot, field))
+    return lines
 
-    # 5. DTE preference guidance
-    if config.PREFERRED_MIN_DTE <= snapshot.days_to_expiry <= config.PREFERRED_MAX_DTE:
-        reasons.append(
-            f"DTE in preferred window ({config.PREFERRED_MIN_DTE}–{config.PREFERRED_MAX_DTE})"
-        )
-    elif snapshot.days_to_expiry < config.PREFERRED_MIN_DTE:
-        reasons.append(
-            f"DTE below preferred window (<{config.PREFERRED_MIN_DTE}) → higher gamma/theta sensitivity"
-        )
-    else:
-        reasons.append(
-            f"DTE above preferred window (>{config.PREFERRED_MAX_DTE}) → more vega/carry, less capital efficient"
-        )
 
-    # 6. Objective-driven posture selection
-    action: Action = "DO NOTHING"
+# Volatility regime codes, ordered so the code is the number of cutoffs exceeded
+REGIME_LOW, REGIME_MID, REGIME_HIGH = range(3)
+
+_REGIME_REASON: tuple[int, ...] = (REASON_IV_LOW, REASON_IV_MID, REASON_IV_HIGH)
+
+
+def _vol_regime_code(iv_rank: float, iv_low: float, iv_high: float) -> int:
+    # Branchless: low (<= iv_low) -> 0, mid -> 1, high (>= iv_high) -> 2
+    return (iv_rank >= iv_high) + (iv_rank > iv_low)
+
 
-    if snapshot.objective == "speculate":
+def _objective_posture(regime: int, dte: int, event: bool, objective: str) -> tuple[Action, int]:
+    """
+    Reference rules for objective-driven posture selection.
+
+    Only used at import time to build `_POSTURE_TABLE`; `classify` does the lookup.
+    """
+    if objective == "speculate":
         # Speculation: prefer long premium when IV is cheap and time isn't too short.
-        if regime == "low" and snapshot.days_to_expiry >= config.PREFERRED_MIN_DTE and not snapshot.upcoming_event:
-            action = "BUY PREMIUM (prefer defined-risk spreads)"
-            reasons.append("Objective = speculate: low IV + enough time + no event → better conditions to buy premium")
-        elif regime == "high":
-            action = "SELL PREMIUM (use defined-risk structures)"
-            reasons.append("Objective = speculate: high IV → consider selling premium rather than buying it")
-        else:
-            action = "DO NOTHING"
-            reasons.append("Objective = speculate: no clear edge from regime/time/event filters")
+        if regime == REGIME_LOW and dte >= config.PREFERRED_MIN_DTE and not event:
+            return Action.BUY, REASON_SPECULATE_BUY
+        if regime == REGIME_HIGH:
+            return Action.SELL, REASON_SPECULATE_SELL
+        return Action.NOTHING, REASON_SPECULATE_NO_EDGE
 
-    elif snapshot.objective == "income":
+    if objective == "income":
         # Income: typically short premium, but avoid doing it when IV is very low.
-        if regime == "high" and config.MIN_DTE <= snapshot.days_to_expiry <= config.PREFERRED_MAX_DTE:
-            action = "SELL PREMIUM (use defined-risk structures)"
-            reasons.append("Objective = income: high IV + workable DTE → premium-selling conditions")
-        elif regime == "low":
-            action = "DO NOTHING"
-            reasons.append("Objective = income: low IV → premium often too small for risk taken")
-        else:
-            action = "DO NOTHING"
-            reasons.append("Objective = income: neutral setup")
+        if regime == REGIME_HIGH and config.MIN_DTE <= dte <= config.PREFERRED_MAX_DTE:
+            return Action.SELL, REASON_INCOME_SELL
+        if regime == REGIME_LOW:
+            return Action.NOTHING, REASON_INCOME_LOW_IV
+        return Action.NOTHING, REASON_INCOME_NEUTRAL
 
-    elif snapshot.objective == "hedge":
+    if objective == "hedge":
         # Hedging: if IV is low, protection is cheaper; if IV is high, prefer cost-controlled structures.
-        if regime == "low" and snapshot.days_to_expiry >= 30:
-            action = "HEDGE (prefer spreads/collars for cost control)"
-            reasons.append("Objective = hedge: low IV + longer DTE → protection relatively cheaper")
-        elif regime == "high":
-            action = "HEDGE (prefer spreads/collars for cost control)"
-            reasons.append("Objective = hedge: high IV → protection expensive; consider spreads/collars to reduce cost")
+        if regime == REGIME_LOW and dte >= config.HEDGE_MIN_DTE:
+            return Action.HEDGE, REASON_HEDGE_LOW_IV
+        if regime == REGIME_HIGH:
+            return Action.HEDGE, REASON_HEDGE_HIGH_IV
+        return Action.HEDGE, REASON_HEDGE_STAGED
+
+    return Action.NOTHING, REASON_UNKNOWN_OBJECTIVE
+
+
+# Every DTE threshold `_objective_posture` compares against; between two edges
+# the rules cannot tell DTE values apart, so one bucket per gap is enough.
+def _build_dte_edges() -> tuple[int, ...]:
+    return tuple(
+        sorted({config.MIN_DTE, config.PREFERRED_MIN_DTE, config.HEDGE_MIN_DTE, config.PREFERRED_MAX_DTE + 1})
+    )
+
+
+_DTE_EDGES = _build_dte_edges()
+
+
+def _build_posture_table() -> dict[tuple[int, int, bool, str], tuple[Action, int]]:
+    """Enumerate (regime, dte_bucket, event, objective) and record what the rules return."""
+    bucket_reps = (0,) + _DTE_EDGES  # lowest DTE in each bucket
+    return {
+        (regime, bucket, event, objective): _objective_posture(regime, dte, event, objective)
+        for regime in (REGIME_LOW, REGIME_MID, REGIME_HIGH)
+        for bucket, dte in enumerate(bucket_reps)
+        for event in (False, True)
+        for objective in OBJECTIVES
+    }
+
+
+_POSTURE_TABLE = _build_posture_table()
+
+
+def _noop(code: int) -> None:
+    pass
+
+
+def _specialize(objective: Optional[str]) -> Callable[[OptionSnapshot, bool], ClassificationResult]:
+    """
+    Stage a classifier for a single objective.
+
+    The objective's slice of `_POSTURE_TABLE` and whether the short-DTE guardrail
+    applies are bound here once, so the returned function never looks at
+    `snapshot.objective`. Unknown objectives get an empty slice.
+
+    Config thresholds are read into locals here too, so the hot path never
+    touches `src.config`; call `reload_config()` after changing it.
+    """
+    postures = {key[:3]: posture for key, posture in _POSTURE_TABLE.items() if key[3] == objective}
+    blocks_short_dte = objective != "hedge"
+    dte_edges = _DTE_EDGES
+    max_spread = config.MAX_BID_ASK_SPREAD_PCT
+    min_dte = config.MIN_DTE
+    preferred_min_dte = config.PREFERRED_MIN_DTE
+    preferred_max_dte = config.PREFERRED_MAX_DTE
+    iv_low = config.IV_RANK_LOW
+    iv_high = config.IV_RANK_HIGH
+
+    def classify_objective(snapshot: OptionSnapshot, explain: bool) -> ClassificationResult:
+        dte: int = snapshot.days_to_expiry
+        event: bool = snapshot.upcoming_event
+        reasons: list[int] = []
+        note: Callable[[int], None] = reasons.append if explain else _noop
+
+        # 1. Liquidity guardrail
+        if snapshot.bid_ask_spread_pct > max_spread:
+            return ClassificationResult(Action.NOTHING, Confidence.LOW, (REASON_LIQUIDITY_BLOCK,) if explain else ())
+        note(REASON_LIQUIDITY_OK)
+
+        # 2. Time-to-expiry guardrail (only hedges may go below MIN_DTE)
+        if dte < min_dte:
+            if blocks_short_dte:
+                return ClassificationResult(Action.NOTHING, Confidence.LOW, (REASON_SHORT_DTE_BLOCK,) if explain else ())
+            note(REASON_SHORT_DTE)
+
+        # 3. Volatility regime
+        regime = _vol_regime_code(snapshot.iv_rank, iv_low, iv_high)
+        note(_REGIME_REASON[regime])
+
+        # 4. Event risk
+        if event:
+            note(REASON_EVENT)
+
+        # 5. DTE preference guidance
+        if preferred_min_dte <= dte <= preferred_max_dte:
+            note(REASON_DTE_PREFERRED)
+        elif dte < preferred_min_dte:
+            note(REASON_DTE_BELOW_PREFERRED)
         else:
-            action = "HEDGE (prefer spreads/collars for cost control)"
-            reasons.append("Objective = hedge: hedge can be staged/scaled to reduce timing risk")
+            note(REASON_DTE_ABOVE_PREFERRED)
+
+        # 6. Objective-driven posture selection
+        action, reason = postures.get(
+            (regime, bisect_right(dte_edges, dte), bool(event)),
+            (Action.NOTHING, REASON_UNKNOWN_OBJECTIVE),
+        )
+        note(reason)
 
-    else:
-        action = "DO NOTHING"
-        reasons.append("Unknown objective (expected: speculate / income / hedge)")
+        # 7. Confidence heuristic (simple + explainable)
+        # The three adjustments are mutually exclusive (BUY needs DTE >= PREFERRED_MIN_DTE,
+        # the raise needs no event and DTE >= PREFERRED_MIN_DTE), so at most one fires and
+        # they are tested most-frequent first.
+        confidence = Confidence.MEDIUM
 
-    # 7. Confidence heuristic (simple + explainable)
-    confidence: Confidence = "medium"
+        if (
+            action != Action.NOTHING
+            and regime != REGIME_MID
+            and not event
+            and preferred_min_dte <= dte <= preferred_max_dte
+        ):  # hit-rate: ~0.21
+            confidence = Confidence.HIGH
+            note(REASON_CONFIDENCE_RAISED)
 
-    if snapshot.upcoming_event and action.startswith("BUY"):
-        confidence = "low"
-        reasons.append("Confidence lowered: buying premium into an event risks IV crush")
+        elif dte < preferred_min_dte and action != Action.HEDGE:  # hit-rate: ~0.10
+            confidence = Confidence.LOW
+            note(REASON_SHORT_DTE_CONFIDENCE)
 
-    if snapshot.days_to_expiry < config.PREFERRED_MIN_DTE and action != "HEDGE (prefer spreads/collars for cost control)":
-        confidence = "low"
-        reasons.append("Confidence lowered: short DTE increases gamma/theta instability")
+        elif event and action == Action.BUY:  # hit-rate: ~0 (speculate only buys without an event)
+            confidence = Confidence.LOW
+            note(REASON_BUY_INTO_EVENT)
 
-    if regime in ("high", "low") and not snapshot.upcoming_event and config.PREFERRED_MIN_DTE <= snapshot.days_to_expiry <= config.PREFERRED_MAX_DTE:
-        if action != "DO NOTHING":
-            confidence = "high"
-            reasons.append("Confidence raised: strong vol regime + preferred DTE window + no event")
+        return ClassificationResult(action, confidence, tuple(reasons))
 
-    return {"action": action, "confidence": confidence, "reasons": reasons}
\ No newline at end of file
+    name = f"_classify_{objective or 'unknown'}"
+    classify_objective.__name__ = classify_objective.__qualname__ = name
+    return classify_objective
+
+
+def _build_dispatch() -> dict[str, Callable[[OptionSnapshot, bool], ClassificationResult]]:
+    return {objective: _specialize(objective) for objective in OBJECTIVES}
+
+
+_DISPATCH = _build_dispatch()
+_classify_unknown = _specialize(None)
+
+
+def classify(snapshot: OptionSnapshot, *, explain: bool = True) -> ClassificationResult:
+    """
+    Classify an options market 'posture' based on volatility regime, time-to-expiry,
+    event risk, and liquidity. This is decision support / regime classification,
+    not a trade signal.
+
+    With `explain=False` no reason codes are recorded (`reasons` is empty); use it
+    when only the action/confidence are needed, e.g. in bulk pipelines. This
+    function is never memoised; see `classify_cached` for repeated snapshots.
+    """
+    return _DISPATCH.get(snapshot.objective, _classify_unknown)(snapshot, explain)
+
+
+# Snapshots are frozen and hashable, so repeat classifications (UI refreshes,
+# re-sorts, what-if exploration) can be served from a cache. Results are
+# immutable, so a cached one can be handed to every caller as-is.
+@functools.lru_cache(maxsize=4096)
+def classify_cached(snapshot: OptionSnapshot) -> ClassificationResult:
+    """
+    Memoised `classify(snapshot)`, for callers that classify the same snapshots
+    repeatedly. Hashing a snapshot costs about as much as classifying it, so
+    streams of distinct snapshots should call `classify` directly.
+    """
+    return classify(snapshot)
+
+
+def reload_config() -> None:
+    """
+    Rebuild everything that baked in `src.config` values, then clear
+    `classify_cached`.
+
+    Call this after changing thresholds at runtime (e.g. in tests).
+    `src.batch.classify_batch` reads the thresholds on every call, so the
+    batch path needs no rebuild.
+    """
+    global _DTE_EDGES, _POSTURE_TABLE, TEMPLATES, _DISPATCH, _classify_unknown
+    _DTE_EDGES = _build_dte_edges()
+    _POSTURE_TABLE = _build_posture_table()
+    TEMPLATES = _build_templates()
+    _DISPATCH = _build_dispatch()
+    _classify_unknown = _specialize(None)
+    classify_cached.cache_clear()
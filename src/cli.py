@@ -2,10 +2,73 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:  # orjson is optional; the stdlib codec gives the same output
+    HAVE_ORJSON = False
 
 from src.models import OptionSnapshot
-from src.classifier import classify
+from src.classifier import Action, Confidence, classify, describe
+
+
+def _loads(data: bytes) -> Any:
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    if HAVE_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _read_snapshots(path: Path) -> list[OptionSnapshot]:
+    """
+    Read a JSON array of snapshot objects, or one object per line (JSONL).
+
+    JSONL is parsed line by line as the file is read; a JSON array has to be
+    decoded in one piece.
+    """
+    with path.open("rb") as fh:
+        for first in fh:
+            if first.strip():
+                break
+        else:
+            return []
+        if first.lstrip().startswith(b"["):
+            return [OptionSnapshot(**raw) for raw in _loads(first + fh.read())]
+        snaps = [OptionSnapshot(**_loads(first))]
+        snaps.extend(OptionSnapshot(**_loads(line)) for line in fh if line.strip())
+        return snaps
+
+
+def _classify_many(path: Path) -> None:
+    """Classify every snapshot in `path` and write one JSON result per line to stdout."""
+    # Imported here so the single-snapshot path never loads NumPy or Numba
+    from src.batch import classify_batch
+    from src.frame import OptionSnapshotFrame
+
+    snaps = _read_snapshots(path)
+    action, confidence = classify_batch(OptionSnapshotFrame.from_records(snaps))
+    out = sys.stdout
+    for snap, a, c in zip(snaps, action, confidence):
+        out.write(
+            _dumps(
+                {
+                    "symbol": snap.symbol,
+                    "action": Action(int(a)).label,
+                    "confidence": Confidence(int(c)).label,
+                }
+            )
+        )
+        out.write("\n")
 
 
 def main() -> None:
@@ -18,13 +81,26 @@ def main() -> None:
         default="data/sample_option_snapshot.json",
         help="Path to a JSON file containing an OptionSnapshot-compatible object",
     )
+    parser.add_argument(
+        "--snapshots",
+        type=str,
+        default=None,
+        help="Path to a JSON array or JSONL file of snapshots; prints one JSON result per line (NDJSON)",
+    )
     args = parser.parse_args()
 
+    if args.snapshots is not None:
+        path = Path(args.snapshots)
+        if not path.exists():
+            raise FileNotFoundError(f"Snapshots file not found: {path}")
+        _classify_many(path)
+        return
+
     path = Path(args.snapshot)
     if not path.exists():
         raise FileNotFoundError(f"Snapshot file not found: {path}")
 
-    raw = json.loads(path.read_text())
+    raw = _loads(path.read_bytes())
     snap = OptionSnapshot(**raw)
     result = classify(snap)
 
@@ -37,10 +113,10 @@ def main() -> None:
     print(f"DTE: {snap.days_to_expiry}")
     print(f"Bid–ask spread: {snap.bid_ask_spread_pct:.2f}%")
 
-    print("\nSuggested posture:", result["action"])
-    print("Confidence:", result["confidence"])
+    print("\nSuggested posture:", result.action.label)
+    print("Confidence:", result.confidence.label)
     print("\nReasons:")
-    for r in result["reasons"]:
+    for r in describe(result, snap):
         print(f"- {r}")
     print("")
 
@@ -47,6 +47,9 @@ MIN_DTE = 7
 PREFERRED_MIN_DTE = 21
 PREFERRED_MAX_DTE = 60
 
+# Hedges at least this far out count as "longer-dated" protection
+HEDGE_MIN_DTE = 30
+
 
 # -----------------------------
 # Liquidity constraints
@@ -72,4 +75,22 @@ MAX_THETA_FRACTION = 0.03
 
 # Number of days before a known event during which IV distortion
 # is assumed to be significant
-EVENT_LOOKAHEAD_DAYS = 7
\ No newline at end of file
+EVENT_LOOKAHEAD_DAYS = 7
+
+
+# -----------------------------
+# Batch precision
+# -----------------------------
+
+# The batch path (OptionSnapshotFrame / classify_batch) stores iv, iv_rank,
+# greeks and bid_ask_spread_pct as float32 and days_to_expiry as int16.
+#
+# - float32 keeps ~7 significant digits. Both batch backends compare the
+#   float32 columns against float32 copies of the thresholds, so they always
+#   agree with each other, and a value equal to a threshold (e.g. a 0.3 spread
+#   against MAX_BID_ASK_SPREAD_PCT = 0.3) classifies as in the scalar path.
+#   Only a value within float32 rounding of a threshold, but not equal to it
+#   (e.g. a 0.30000001 spread), can classify differently from the float64
+#   scalar path.
+# - days_to_expiry above 32767 (~89 years) does not fit int16; building a
+#   frame or batch array from such a snapshot raises ValueError.
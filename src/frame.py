@@ -0,0 +1,154 @@
+"""
+Column-oriented storage for many snapshots, used by the batch classifier.
+
+Kept apart from `src.models` so the scalar path does not import NumPy.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from src.models import OBJECTIVES, OptionSnapshot
+
+
+OBJECTIVE_CODES = {name: code for code, name in enumerate(OBJECTIVES)}
+OBJECTIVE_UNKNOWN = 255
+
+_DTE_MIN, _DTE_MAX = int(np.iinfo(np.int16).min), int(np.iinfo(np.int16).max)
+
+# Code -> objective for to_records(); every unused code decodes to None
+_OBJECTIVE_NAMES = (*OBJECTIVES, *[None] * (256 - len(OBJECTIVES)))
+
+
+@dataclass(slots=True)
+class OptionSnapshotFrame:
+    """
+    Column-oriented (structure-of-arrays) view of many OptionSnapshots.
+
+    Each field is a 1-D NumPy array with one entry per snapshot, so bulk
+    classification can sweep a contiguous column instead of N Python objects.
+
+    Notes:
+    - objective is a uint8 code indexing OBJECTIVES; objectives the classifier
+      does not know are stored as OBJECTIVE_UNKNOWN and come back as None
+    - trend is an object array, since the classifier accepts any trend value
+    - symbol / option_type are object arrays (None when absent)
+    - strike is NaN when absent
+    - iv, iv_rank, greeks and bid_ask_spread_pct are float32 and days_to_expiry
+      is int16 (see "Batch precision" in src/config.py); price and strike stay float64
+    """
+
+    price: np.ndarray
+    trend: np.ndarray
+    days_to_expiry: np.ndarray
+    upcoming_event: np.ndarray
+    iv: np.ndarray
+    iv_rank: np.ndarray
+    delta: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    bid_ask_spread_pct: np.ndarray
+    objective: np.ndarray
+    symbol: np.ndarray
+    option_type: np.ndarray
+    strike: np.ndarray
+
+    def __post_init__(self) -> None:
+        lengths = {f.name: len(getattr(self, f.name)) for f in fields(self)}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"all columns must have the same length, got {lengths}")
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    @classmethod
+    def from_records(cls, snapshots: Iterable[OptionSnapshot]) -> "OptionSnapshotFrame":
+        """Build a frame from snapshots; raises ValueError if a days_to_expiry overflows int16."""
+        # One attrgetter call per snapshot pulls every field as a tuple; zip(*)
+        # then transposes the rows into columns in a single pass.
+        rows = list(map(_GET_COLUMNS, snapshots))
+        (
+            price,
+            trend,
+            days_to_expiry,
+            upcoming_event,
+            iv,
+            iv_rank,
+            delta,
+            theta,
+            vega,
+            bid_ask_spread_pct,
+            objective,
+            symbol,
+            option_type,
+            strike,
+        ) = list(zip(*rows)) or [()] * len(_FRAME_COLUMNS)
+        return cls(
+            price=np.array(price, dtype=np.float64),
+            trend=np.array(trend, dtype=object),
+            days_to_expiry=dte_column(days_to_expiry),
+            upcoming_event=np.array(upcoming_event, dtype=np.bool_),
+            iv=np.array(iv, dtype=np.float32),
+            iv_rank=np.array(iv_rank, dtype=np.float32),
+            delta=np.array(delta, dtype=np.float32),
+            theta=np.array(theta, dtype=np.float32),
+            vega=np.array(vega, dtype=np.float32),
+            bid_ask_spread_pct=np.array(bid_ask_spread_pct, dtype=np.float32),
+            objective=np.array(
+                [OBJECTIVE_CODES.get(o, OBJECTIVE_UNKNOWN) for o in objective], dtype=np.uint8
+            ),
+            symbol=np.array(symbol, dtype=object),
+            option_type=np.array(option_type, dtype=object),
+            strike=np.array([np.nan if k is None else k for k in strike], dtype=np.float64),
+        )
+
+    def to_records(self) -> list[OptionSnapshot]:
+        """
+        Rebuild scalar snapshots (values are trusted, so validation is skipped).
+
+        Downcast columns come back at float32 precision, not the original float64
+        values, and unknown objectives come back as None.
+        """
+        return [
+            OptionSnapshot.unchecked(
+                price=float(self.price[i]),
+                trend=self.trend[i],
+                days_to_expiry=int(self.days_to_expiry[i]),
+                upcoming_event=bool(self.upcoming_event[i]),
+                iv=float(self.iv[i]),
+                iv_rank=float(self.iv_rank[i]),
+                delta=float(self.delta[i]),
+                theta=float(self.theta[i]),
+                vega=float(self.vega[i]),
+                bid_ask_spread_pct=float(self.bid_ask_spread_pct[i]),
+                objective=_OBJECTIVE_NAMES[self.objective[i]],
+                symbol=self.symbol[i],
+                option_type=self.option_type[i],
+                strike=None if np.isnan(self.strike[i]) else float(self.strike[i]),
+            )
+            for i in range(len(self))
+        ]
+
+
+# Frame columns share their names with OptionSnapshot fields
+_FRAME_COLUMNS = tuple(f.name for f in fields(OptionSnapshotFrame))
+_GET_COLUMNS = attrgetter(*_FRAME_COLUMNS)
+
+
+def dte_column(days_to_expiry: Sequence[int]) -> np.ndarray:
+    """
+    Pack days_to_expiry values into the int16 column used by the batch path.
+
+    The range is checked explicitly because NumPy < 2 wraps out-of-range
+    values silently instead of raising.
+    """
+    values = np.asarray(days_to_expiry, dtype=np.int64)
+    if values.size and (values.min() < _DTE_MIN or values.max() > _DTE_MAX):
+        raise ValueError(
+            f"days_to_expiry must be between {_DTE_MIN} and {_DTE_MAX} for batch classification"
+        )
+    return values.astype(np.int16)
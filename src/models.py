@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal, Optional
+from dataclasses import MISSING, dataclass, fields
+from typing import Any, Literal, Optional
 
 
 Trend = Literal["up", "down", "sideways"]
 Objective = Literal["speculate", "income", "hedge"]
 
+# Objective codes used by the batch path are the tuple index
+OBJECTIVES: tuple[Objective, ...] = ("speculate", "income", "hedge")
+
 
 @dataclass(frozen=True, slots=True)
 class OptionSnapshot:
@@ -72,4 +75,28 @@ class OptionSnapshot:
             raise ValueError("option_type must be 'call' or 'put' if provided")
 
         if self.strike is not None and self.strike <= 0:
-            raise ValueError("strike must be > 0 if provided")
\ No newline at end of file
+            raise ValueError("strike must be > 0 if provided")
+
+    @classmethod
+    def unchecked(cls, **kwargs: Any) -> "OptionSnapshot":
+        """
+        Build a snapshot without running `__post_init__` validation.
+
+        Only for trusted internal pipelines (batch ETL, frame round-trips) where the
+        values were already validated; user input should go through the constructor.
+        """
+        obj = object.__new__(cls)
+        for name, default in _SNAPSHOT_FIELDS:
+            if name in kwargs:
+                value = kwargs.pop(name)
+            elif default is not MISSING:
+                value = default
+            else:
+                raise TypeError(f"unchecked() missing required field: {name!r}")
+            object.__setattr__(obj, name, value)
+        if kwargs:
+            raise TypeError(f"unchecked() got unexpected fields: {sorted(kwargs)}")
+        return obj
+
+
+_SNAPSHOT_FIELDS = tuple((f.name, f.default) for f in fields(OptionSnapshot))
@@ -0,0 +1,165 @@
+"""
+TESTS FOR BATCH CLASSIFICATION
+
+The vectorised classifier must agree with the scalar rules engine on every
+input, so these tests sweep a grid of snapshots through both paths.
+"""
+
+import itertools
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+from src import config
+from src._decide import _decide_many, current_thresholds
+from src.batch import (
+    BATCH_DTYPE,
+    _classify_masks,
+    classify_batch,
+    snapshots_to_array,
+)
+from src.classifier import classify, reload_config
+from src.frame import OBJECTIVE_UNKNOWN, OptionSnapshotFrame
+from src.models import OptionSnapshot
+
+
+def make_grid() -> list:
+    """Helper: snapshots covering every threshold edge in `src.config`."""
+    grid = itertools.product(
+        (0.0, 20.0, 30.0, 45.0, 60.0, 90.0),             # iv_rank
+        (1, 6, 7, 20, 21, 29, 30, 45, 60, 61, 120),     # days_to_expiry
+        (0.4, 1.0, 2.5),                                # bid_ask_spread_pct
+        (False, True),                                  # upcoming_event
+        ("speculate", "income", "hedge"),               # objective
+    )
+    return [
+        OptionSnapshot(
+            price=100.0,
+            trend="sideways",
+            days_to_expiry=dte,
+            upcoming_event=event,
+            iv=0.30,
+            iv_rank=iv_rank,
+            delta=0.30,
+            theta=-0.03,
+            vega=0.10,
+            bid_ask_spread_pct=spread,
+            objective=objective,
+        )
+        for iv_rank, dte, spread, event, objective in grid
+    ]
+
+
+def test_batch_matches_scalar_classifier():
+    snaps = make_grid()
+    action, confidence = classify_batch(snapshots_to_array(snaps))
+
+    for snap, a, c in zip(snaps, action, confidence):
+        expected = classify(snap)
+        assert a == expected.action, snap
+        assert c == expected.confidence, snap
+
+
+def test_batch_accepts_empty_input():
+    action, confidence = classify_batch(np.empty(0, dtype=BATCH_DTYPE))
+    assert action.shape == (0,)
+    assert confidence.shape == (0,)
+
+    frame = OptionSnapshotFrame.from_records([])
+    assert len(frame) == 0
+    assert frame.iv_rank.dtype == np.float32
+
+
+def assert_backends_agree(snaps: list) -> None:
+    """Helper: the Numba kernel, the NumPy masks and `classify` give the same codes."""
+    arr = snapshots_to_array(snaps)
+    columns = (arr["iv_rank"], arr["dte"], arr["spread"], arr["event"], arr["objective"])
+    thresholds = current_thresholds()
+
+    kernel_action, kernel_confidence = _decide_many(*columns, *thresholds)
+    mask_action, mask_confidence = _classify_masks(*columns, *thresholds)
+
+    np.testing.assert_array_equal(kernel_action, mask_action)
+    np.testing.assert_array_equal(kernel_confidence, mask_confidence)
+    for snap, a, c in zip(snaps, kernel_action, kernel_confidence):
+        expected = classify(snap)
+        assert (a, c) == (expected.action, expected.confidence), snap
+
+
+def test_compiled_kernel_matches_numpy_masks():
+    assert_backends_agree(make_grid())
+
+
+def test_threshold_change_reaches_every_backend(monkeypatch):
+    snaps = make_grid()
+    before, _ = classify_batch(snapshots_to_array(snaps))
+
+    monkeypatch.setattr(config, "IV_RANK_HIGH", 45.0)
+    monkeypatch.setattr(config, "PREFERRED_MIN_DTE", 21)
+    monkeypatch.setattr(config, "MAX_BID_ASK_SPREAD_PCT", 2.0)
+    try:
+        reload_config()
+        assert_backends_agree(snaps)
+        after, _ = classify_batch(snapshots_to_array(snaps))
+        assert not np.array_equal(before, after)
+    finally:
+        monkeypatch.undo()
+        reload_config()
+
+
+def test_frame_round_trips_and_classifies_like_array():
+    snaps = make_grid()
+    frame = OptionSnapshotFrame.from_records(snaps)
+
+    assert len(frame) == len(snaps)
+    assert frame.iv_rank.dtype == np.float32
+    assert frame.days_to_expiry.dtype == np.int16
+    for restored, original in zip(frame.to_records(), snaps):
+        assert asdict(restored) == pytest.approx(asdict(original))
+
+    frame_action, frame_confidence = classify_batch(frame)
+    array_action, array_confidence = classify_batch(snapshots_to_array(snaps))
+    np.testing.assert_array_equal(frame_action, array_action)
+    np.testing.assert_array_equal(frame_confidence, array_confidence)
+
+
+def test_frame_accepts_values_scalar_classify_accepts():
+    snaps = [
+        OptionSnapshot(**{**asdict(s), "trend": "flat", "objective": "retire"})
+        for s in make_grid()[:50]
+    ]
+    frame = OptionSnapshotFrame.from_records(snaps)
+
+    assert (frame.objective == OBJECTIVE_UNKNOWN).all()
+    restored = frame.to_records()
+    assert restored[0].trend == "flat"
+    assert restored[0].objective is None
+
+    action, confidence = classify_batch(frame)
+    for snap, a, c in zip(snaps, action, confidence):
+        expected = classify(snap)
+        assert (a, c) == (expected.action, expected.confidence), snap
+
+
+def test_float32_threshold_edge_agrees_across_backends(monkeypatch):
+    # 0.3 is not exact in float32; both backends must compare it in float32
+    monkeypatch.setattr(config, "MAX_BID_ASK_SPREAD_PCT", 0.3)
+    try:
+        reload_config()
+        snaps = [
+            OptionSnapshot(**{**asdict(s), "bid_ask_spread_pct": 0.3})
+            for s in make_grid()
+        ]
+        assert_backends_agree(snaps)
+    finally:
+        monkeypatch.undo()
+        reload_config()
+
+
+def test_days_to_expiry_beyond_int16_raises_value_error():
+    snap = OptionSnapshot(**{**asdict(make_grid()[0]), "days_to_expiry": 40000})
+    with pytest.raises(ValueError, match="days_to_expiry"):
+        OptionSnapshotFrame.from_records([snap])
+    with pytest.raises(ValueError, match="days_to_expiry"):
+        snapshots_to_array([snap])
@@ -16,10 +16,35 @@ The goal is to ensure that:
 
 """
 
+from bisect import bisect_right
+from dataclasses import asdict
+
 import pytest
 
 from src.models import OptionSnapshot
-from src.classifier import classify
+from src.classifier import (
+    Action,
+    Confidence,
+    REASON_BUY_INTO_EVENT,
+    REASON_INCOME_LOW_IV,
+    REASON_INCOME_SELL,
+    REASON_IV_HIGH,
+    REASON_IV_LOW,
+    REASON_LIQUIDITY_BLOCK,
+    REASON_SHORT_DTE_BLOCK,
+    REGIME_HIGH,
+    REGIME_LOW,
+    REGIME_MID,
+    _DTE_EDGES,
+    _POSTURE_TABLE,
+    _objective_posture,
+    _vol_regime_code,
+    classify,
+    classify_cached,
+    describe,
+    reload_config,
+)
+from src import config
 
 
 def make_snapshot(**overrides) -> OptionSnapshot:
@@ -44,60 +69,100 @@ def make_snapshot(**overrides) -> OptionSnapshot:
 def test_liquidity_filter_blocks_trade():
     s = make_snapshot(bid_ask_spread_pct=2.5)
     result = classify(s)
-    assert result["action"] == "DO NOTHING"
-    assert result["confidence"] == "low"
-    assert any("Liquidity filter" in r for r in result["reasons"])
+    assert result.action == Action.NOTHING
+    assert result.confidence == Confidence.LOW
+    assert REASON_LIQUIDITY_BLOCK in result.reasons
 
 
 def test_short_dte_blocks_non_hedge():
     s = make_snapshot(days_to_expiry=3, objective="speculate")
     result = classify(s)
-    assert result["action"] == "DO NOTHING"
-    assert result["confidence"] == "low"
-    assert any("Very short DTE" in r for r in result["reasons"])
+    assert result.action == Action.NOTHING
+    assert result.confidence == Confidence.LOW
+    assert REASON_SHORT_DTE_BLOCK in result.reasons
 
 
 def test_low_iv_speculate_prefers_buy_premium():
     s = make_snapshot(iv_rank=20.0, days_to_expiry=35, upcoming_event=False, objective="speculate")
     result = classify(s)
-    assert result["action"].startswith("BUY PREMIUM")
-    assert result["confidence"] in ("medium", "high")
-    assert any("IV Rank low" in r for r in result["reasons"])
+    assert result.action == Action.BUY
+    assert result.confidence in (Confidence.MEDIUM, Confidence.HIGH)
+    assert REASON_IV_LOW in result.reasons
 
 
 def test_high_iv_speculate_prefers_sell_premium():
     s = make_snapshot(iv_rank=75.0, objective="speculate")
     result = classify(s)
-    assert result["action"].startswith("SELL PREMIUM")
-    assert any("IV Rank high" in r for r in result["reasons"])
+    assert result.action == Action.SELL
+    assert REASON_IV_HIGH in result.reasons
 
 
 def test_income_high_iv_prefers_sell_premium_in_workable_dte():
     s = make_snapshot(iv_rank=80.0, objective="income", days_to_expiry=45)
     result = classify(s)
-    assert result["action"].startswith("SELL PREMIUM")
-    assert any("Objective = income" in r for r in result["reasons"])
+    assert result.action == Action.SELL
+    assert REASON_INCOME_SELL in result.reasons
 
 
 def test_income_low_iv_does_nothing():
     s = make_snapshot(iv_rank=10.0, objective="income")
     result = classify(s)
-    assert result["action"] == "DO NOTHING"
-    assert any("low iv" in r.lower() for r in result["reasons"])
+    assert result.action == Action.NOTHING
+    assert REASON_INCOME_LOW_IV in result.reasons
 
 
 def test_hedge_always_returns_hedge_posture():
     s = make_snapshot(objective="hedge", iv_rank=50.0)
     result = classify(s)
-    assert result["action"].startswith("HEDGE")
+    assert result.action == Action.HEDGE
 
 
 def test_buy_into_event_lowers_confidence_when_buying():
     s = make_snapshot(iv_rank=20.0, objective="speculate", upcoming_event=True, days_to_expiry=35)
     result = classify(s)
-    if result["action"].startswith("BUY PREMIUM"):
-        assert result["confidence"] == "low"
-        assert any("IV crush" in r for r in result["reasons"])
+    if result.action == Action.BUY:
+        assert result.confidence == Confidence.LOW
+        assert REASON_BUY_INTO_EVENT in result.reasons
+
+
+def test_vol_regime_code_respects_cutoffs():
+    low, high = config.IV_RANK_LOW, config.IV_RANK_HIGH
+    assert _vol_regime_code(low, low, high) == REGIME_LOW
+    assert _vol_regime_code(low + 0.1, low, high) == REGIME_MID
+    assert _vol_regime_code(high - 0.1, low, high) == REGIME_MID
+    assert _vol_regime_code(high, low, high) == REGIME_HIGH
+
+
+def test_posture_table_matches_reference_rules():
+    for key in _POSTURE_TABLE:
+        regime, _, event, objective = key
+        for dte in range(1, 121):
+            if bisect_right(_DTE_EDGES, dte) == key[1]:
+                assert _POSTURE_TABLE[key] == _objective_posture(regime, dte, event, objective)
+
+
+def test_explain_false_skips_reasons_only():
+    classify_cached.cache_clear()
+    for overrides in (
+        dict(bid_ask_spread_pct=2.5),
+        dict(days_to_expiry=3),
+        dict(iv_rank=20.0),
+        dict(iv_rank=80.0, objective="income"),
+        dict(objective="hedge", days_to_expiry=3),
+    ):
+        s = make_snapshot(**overrides)
+        full = classify(s)
+        quiet = classify(s, explain=False)
+        assert (quiet.action, quiet.confidence) == (full.action, full.confidence)
+        assert quiet.reasons == ()
+    # The bulk path must not pay for hashing snapshots into the cache
+    assert classify_cached.cache_info().currsize == 0
+
+
+def test_describe_renders_reason_text():
+    s = make_snapshot(bid_ask_spread_pct=2.5)
+    reasons = describe(classify(s), s)
+    assert reasons == ["Liquidity filter: bid–ask spread 2.50% > 1.00% threshold"]
 
 
 def test_models_validation_rejects_invalid_inputs():
@@ -112,3 +177,47 @@ def test_models_validation_rejects_invalid_inputs():
 
     with pytest.raises(ValueError):
         _ = make_snapshot(bid_ask_spread_pct=-0.1)
+
+
+def test_classify_cached_caches_by_value():
+    classify_cached.cache_clear()
+    first = classify_cached(make_snapshot())
+    second = classify_cached(make_snapshot())  # equal by value -> cache hit
+    assert classify_cached.cache_info().hits == 1
+    assert second == first == classify(make_snapshot())
+
+    reload_config()
+    assert classify_cached.cache_info().currsize == 0
+
+
+def test_as_dict_keeps_public_labels():
+    result = classify(make_snapshot(bid_ask_spread_pct=2.5))
+    assert result.as_dict() == {
+        "action": "DO NOTHING",
+        "confidence": "low",
+        "reasons": [REASON_LIQUIDITY_BLOCK],
+    }
+
+
+def test_reload_config_picks_up_changed_thresholds(monkeypatch):
+    s = make_snapshot(iv_rank=75.0)
+    assert REASON_IV_HIGH in classify(s).reasons
+
+    monkeypatch.setattr(config, "IV_RANK_HIGH", 80.0)
+    try:
+        reload_config()
+        assert REASON_IV_HIGH not in classify(s).reasons
+    finally:
+        monkeypatch.undo()
+        reload_config()
+
+
+def test_unchecked_snapshot_skips_validation_but_matches_constructor():
+    s = make_snapshot()
+    assert OptionSnapshot.unchecked(**asdict(s)) == s
+
+    # No ValueError: validation is the caller's responsibility here
+    assert OptionSnapshot.unchecked(**{**asdict(s), "price": -1.0}).price == -1.0
+
+    with pytest.raises(TypeError):
+        OptionSnapshot.unchecked(price=100.0)
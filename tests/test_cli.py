@@ -0,0 +1,98 @@
+"""
+TESTS FOR THE COMMAND-LINE INTERFACE
+
+Batch mode (--snapshots) must read both a JSON array and JSONL, write one
+JSON result per line, and fail clearly when the input file is missing.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src import cli
+from src.classifier import classify
+from src.models import OptionSnapshot
+
+
+SNAPSHOT = {
+    "symbol": "AAPL",
+    "price": 100.0,
+    "trend": "up",
+    "days_to_expiry": 35,
+    "upcoming_event": False,
+    "iv": 0.25,
+    "iv_rank": 22.0,
+    "delta": 0.35,
+    "theta": -0.03,
+    "vega": 0.10,
+    "bid_ask_spread_pct": 0.4,
+    "objective": "speculate",
+}
+
+
+def make_records() -> list:
+    """Helper: a few snapshot dicts, including a trend the Literal does not list."""
+    return [
+        SNAPSHOT,
+        {**SNAPSHOT, "symbol": "MSFT", "iv_rank": 72.0, "objective": "income"},
+        {**SNAPSHOT, "symbol": "FLAT", "trend": "flat", "bid_ask_spread_pct": 2.5},
+    ]
+
+
+def run_batch(monkeypatch, capsys, path) -> list:
+    """Helper: run `--snapshots path` and parse the NDJSON output."""
+    monkeypatch.setattr("sys.argv", ["cli", "--snapshots", str(path)])
+    cli.main()
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_snapshots_reads_json_array_and_jsonl_alike(tmp_path, monkeypatch, capsys):
+    records = make_records()
+    array_path = tmp_path / "snaps.json"
+    array_path.write_text("\n\n" + json.dumps(records, indent=2))
+    jsonl_path = tmp_path / "snaps.jsonl"
+    jsonl_path.write_text("\n".join(json.dumps(r) for r in records) + "\n\n")
+
+    assert run_batch(monkeypatch, capsys, array_path) == run_batch(monkeypatch, capsys, jsonl_path)
+
+
+def test_snapshots_writes_one_result_per_line(tmp_path, monkeypatch, capsys):
+    records = make_records()
+    path = tmp_path / "snaps.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in records))
+
+    results = run_batch(monkeypatch, capsys, path)
+
+    assert len(results) == len(records)
+    for record, result in zip(records, results):
+        expected = classify(OptionSnapshot(**record))
+        assert result == {
+            "symbol": record["symbol"],
+            "action": expected.action.label,
+            "confidence": expected.confidence.label,
+        }
+
+
+def test_snapshots_missing_file_raises(tmp_path, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["cli", "--snapshots", str(tmp_path / "missing.jsonl")])
+    with pytest.raises(FileNotFoundError, match="Snapshots file not found"):
+        cli.main()
+
+
+def test_snapshots_empty_file_prints_nothing(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "empty.jsonl"
+    path.write_text("\n  \n")
+    assert run_batch(monkeypatch, capsys, path) == []
+
+
+def test_single_snapshot_path_does_not_import_numpy():
+    # A fresh interpreter, since this test session has already imported NumPy
+    code = "import sys, src.cli; print('numpy' in sys.modules, 'numba' in sys.modules)"
+    repo_root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.split() == ["False", "False"]